@@ -1,8 +1,8 @@
 import argparse
 import logging
 
-from module.yaml_loader import get_all_players
-from module.combat import run_combat_simulation, CombatSimulator
+from module.yaml_loader import get_all_players, load_npcs
+from module.combat import run_combat_simulation
 from module.config import load_config
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
@@ -29,12 +29,9 @@ def main():
     config = load_config()
     logging.info(f"Configuration loaded: {config.number_of_fights:,} fights")
     
-    # Load all players and NPCs
+    # Load all players and NPCs once and hand them to the simulation
     players = get_all_players()
-    
-    # Load NPCs using combat simulator's method
-    simulator = CombatSimulator()
-    npcs = simulator.load_npcs()
+    npcs = load_npcs()
     
     logging.info(f"Loaded {len(players)} players and {len(npcs)} NPCs")
     
@@ -5,51 +5,136 @@ This module handles combat mechanics, statistics tracking, and battle resolution
 between Player Characters (PCs) and Non-Player Characters (NPCs).
 """
 
+import io
 import os
-import yaml
+import sys
 import random
-import copy
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
-
-from module.yaml_loader import get_all_players
+import logging
+import multiprocessing
+import numpy as np
+from typing import List, Dict, TextIO, Tuple
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from functools import partial
+
+from module.yaml_loader import get_all_players, load_npcs
 from module.npc import NPC
-from module.player import Player
+from module.player import Player, RESISTANCE_TYPES
 from module.config import SimulationConfig
 
+# Shared result of a missed NPC attack: no resistance type, no damage
+_MISS: Tuple[int, int] = (-1, 0)
+
+
+def _attack_counters() -> Dict[str, int]:
+    return {"attacks": 0, "hits": 0, "damage": 0}
+
+
+def _damage_counters() -> Dict[str, int]:
+    return {"blood": 0, "echo": 0, "mind": 0, "fortune": 0, "supplies": 0, "total": 0}
+
+
+def _fallout_counters() -> Dict[str, int]:
+    return {"minor_fallouts": 0, "major_fallouts": 0, "deaths": 0}
+
 
-@dataclass
+@dataclass(slots=True)
 class CombatStats:
-    """Tracks statistics for a single combat encounter."""
+    """Tracks statistics for a single combat encounter.
+
+    Per-character counters are lists indexed by the character's position in
+    the simulator's PC or NPC list.
+    """
     
     # Combat metrics
     rounds: int = 0
     pc_defeats: int = 0
     npc_defeats: int = 0
-    total_damage_to_pcs: int = 0
-    total_damage_to_npcs: int = 0
 
-    # Per-character tracking dictionaries
-    pc_individual_stats: Dict[str, Dict[str, int]] = None
-    npc_individual_stats: Dict[str, Dict[str, int]] = None
-    pc_damage_received: Dict[str, Dict[str, int]] = None
-    pc_fallouts: Dict[str, Dict[str, int]] = None
+    # Per-character counters
+    num_pcs: int = 0
+    num_npcs: int = 0
+    pc_attacks: List[int] = None
+    pc_hits: List[int] = None
+    pc_damage: List[int] = None
+    npc_attacks: List[int] = None
+    npc_hits: List[int] = None
+    npc_damage: List[int] = None
+    pc_damage_by_type: List[List[int]] = None
+    pc_minor_fallouts: List[int] = None
+    pc_major_fallouts: List[int] = None
+    pc_deaths: List[int] = None
+
+    # Zero lists sized at construction, copied over the counters on reset
+    _pc_zeros: List[int] = field(init=False, repr=False, compare=False)
+    _npc_zeros: List[int] = field(init=False, repr=False, compare=False)
+    _type_zeros: List[int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Initialize tracking dictionaries if not provided."""
-        if self.pc_individual_stats is None:
-            self.pc_individual_stats = {}
-        if self.npc_individual_stats is None:
-            self.npc_individual_stats = {}
-        if self.pc_damage_received is None:
-            self.pc_damage_received = {}
-        if self.pc_fallouts is None:
-            self.pc_fallouts = {}
-
-
-@dataclass
+        """Initialize per-character counters if not provided."""
+        if self.pc_attacks is None:
+            self.pc_attacks = [0] * self.num_pcs
+        if self.pc_hits is None:
+            self.pc_hits = [0] * self.num_pcs
+        if self.pc_damage is None:
+            self.pc_damage = [0] * self.num_pcs
+        if self.npc_attacks is None:
+            self.npc_attacks = [0] * self.num_npcs
+        if self.npc_hits is None:
+            self.npc_hits = [0] * self.num_npcs
+        if self.npc_damage is None:
+            self.npc_damage = [0] * self.num_npcs
+        if self.pc_damage_by_type is None:
+            self.pc_damage_by_type = [[0] * len(RESISTANCE_TYPES) for _ in range(self.num_pcs)]
+        if self.pc_minor_fallouts is None:
+            self.pc_minor_fallouts = [0] * self.num_pcs
+        if self.pc_major_fallouts is None:
+            self.pc_major_fallouts = [0] * self.num_pcs
+        if self.pc_deaths is None:
+            self.pc_deaths = [0] * self.num_pcs
+
+        self._pc_zeros = [0] * self.num_pcs
+        self._npc_zeros = [0] * self.num_npcs
+        self._type_zeros = [0] * len(RESISTANCE_TYPES)
+
+    def reset(self):
+        """Zero all counters in place so the same object can track the next fight."""
+        self.rounds = 0
+        self.pc_defeats = 0
+        self.npc_defeats = 0
+
+        pc_zeros = self._pc_zeros
+        self.pc_attacks[:] = pc_zeros
+        self.pc_hits[:] = pc_zeros
+        self.pc_damage[:] = pc_zeros
+        self.pc_minor_fallouts[:] = pc_zeros
+        self.pc_major_fallouts[:] = pc_zeros
+        self.pc_deaths[:] = pc_zeros
+
+        npc_zeros = self._npc_zeros
+        self.npc_attacks[:] = npc_zeros
+        self.npc_hits[:] = npc_zeros
+        self.npc_damage[:] = npc_zeros
+
+        for damage_by_type in self.pc_damage_by_type:
+            damage_by_type[:] = self._type_zeros
+
+    @property
+    def total_damage_to_pcs(self) -> int:
+        return sum(self.npc_damage)
+
+    @property
+    def total_damage_to_npcs(self) -> int:
+        return sum(self.pc_damage)
+
+
+@dataclass(slots=True)
 class SimulationResults:
-    """Aggregates statistics across multiple combat simulations."""
+    """Aggregates statistics across multiple combat simulations.
+
+    Per-character totals are NumPy arrays indexed like pc_names and npc_names.
+    Characters sharing a name are merged when the per-name views are built.
+    """
     
     # Overall fight statistics
     total_fights: int = 0
@@ -60,21 +145,48 @@ class SimulationResults:
     total_rounds: int = 0
 
     # Aggregated per-character statistics
-    pc_stats: Dict[str, Dict[str, int]] = None
-    npc_stats: Dict[str, Dict[str, int]] = None
-    pc_damage_taken: Dict[str, Dict[str, int]] = None
-    pc_fallout_stats: Dict[str, Dict[str, int]] = None
+    pc_names: List[str] = None
+    npc_names: List[str] = None
+    pc_attacks: np.ndarray = None
+    pc_hits: np.ndarray = None
+    pc_damage: np.ndarray = None
+    npc_attacks: np.ndarray = None
+    npc_hits: np.ndarray = None
+    npc_damage: np.ndarray = None
+    pc_damage_by_type: np.ndarray = None
+    pc_minor_fallouts: np.ndarray = None
+    pc_major_fallouts: np.ndarray = None
+    pc_deaths: np.ndarray = None
 
     def __post_init__(self):
-        """Initialize statistics dictionaries if not provided."""
-        if self.pc_stats is None:
-            self.pc_stats = {}
-        if self.npc_stats is None:
-            self.npc_stats = {}
-        if self.pc_damage_taken is None:
-            self.pc_damage_taken = {}
-        if self.pc_fallout_stats is None:
-            self.pc_fallout_stats = {}
+        """Initialize statistics arrays if not provided."""
+        if self.pc_names is None:
+            self.pc_names = []
+        if self.npc_names is None:
+            self.npc_names = []
+
+        num_pcs = len(self.pc_names)
+        num_npcs = len(self.npc_names)
+        if self.pc_attacks is None:
+            self.pc_attacks = np.zeros(num_pcs, dtype=np.int64)
+        if self.pc_hits is None:
+            self.pc_hits = np.zeros(num_pcs, dtype=np.int64)
+        if self.pc_damage is None:
+            self.pc_damage = np.zeros(num_pcs, dtype=np.int64)
+        if self.npc_attacks is None:
+            self.npc_attacks = np.zeros(num_npcs, dtype=np.int64)
+        if self.npc_hits is None:
+            self.npc_hits = np.zeros(num_npcs, dtype=np.int64)
+        if self.npc_damage is None:
+            self.npc_damage = np.zeros(num_npcs, dtype=np.int64)
+        if self.pc_damage_by_type is None:
+            self.pc_damage_by_type = np.zeros((num_pcs, len(RESISTANCE_TYPES)), dtype=np.int64)
+        if self.pc_minor_fallouts is None:
+            self.pc_minor_fallouts = np.zeros(num_pcs, dtype=np.int64)
+        if self.pc_major_fallouts is None:
+            self.pc_major_fallouts = np.zeros(num_pcs, dtype=np.int64)
+        if self.pc_deaths is None:
+            self.pc_deaths = np.zeros(num_pcs, dtype=np.int64)
 
     def add_fight_result(
         self, pc_won: bool, npc_won: bool, rounds: int, combat_stats: "CombatStats"
@@ -93,77 +205,85 @@ class SimulationResults:
 
         self.average_rounds = self.total_rounds / self.total_fights
 
-        self._aggregate_pc_stats(combat_stats)
-        self._aggregate_npc_stats(combat_stats)
-        self._aggregate_damage_stats(combat_stats)
-        self._aggregate_fallout_stats(combat_stats)
-
-    def _aggregate_pc_stats(self, combat_stats: "CombatStats") -> None:
-        """Aggregate PC attack statistics."""
-        for pc_name, stats in combat_stats.pc_individual_stats.items():
-            if pc_name not in self.pc_stats:
-                self.pc_stats[pc_name] = {"attacks": 0, "hits": 0, "damage": 0}
-
-            self.pc_stats[pc_name]["attacks"] += stats["attacks"]
-            self.pc_stats[pc_name]["hits"] += stats["hits"]
-            self.pc_stats[pc_name]["damage"] += stats["damage"]
-
-    def _aggregate_npc_stats(self, combat_stats: "CombatStats") -> None:
-        """Aggregate NPC attack statistics."""
-        for npc_name, stats in combat_stats.npc_individual_stats.items():
-            if npc_name not in self.npc_stats:
-                self.npc_stats[npc_name] = {"attacks": 0, "hits": 0, "damage": 0}
-
-            self.npc_stats[npc_name]["attacks"] += stats["attacks"]
-            self.npc_stats[npc_name]["hits"] += stats["hits"]
-            self.npc_stats[npc_name]["damage"] += stats["damage"]
-
-    def _aggregate_damage_stats(self, combat_stats: "CombatStats") -> None:
-        """Aggregate PC damage received statistics."""
-        for pc_name, damage_stats in combat_stats.pc_damage_received.items():
-            if pc_name not in self.pc_damage_taken:
-                self.pc_damage_taken[pc_name] = {
-                    "blood": 0, "echo": 0, "mind": 0, "fortune": 0, "supplies": 0, "total": 0
-                }
-
-            for damage_type, amount in damage_stats.items():
-                self.pc_damage_taken[pc_name][damage_type] += amount
-
-    def _aggregate_fallout_stats(self, combat_stats: "CombatStats") -> None:
-        """Aggregate PC fallout statistics."""
-        for pc_name, fallout_stats in combat_stats.pc_fallouts.items():
-            if pc_name not in self.pc_fallout_stats:
-                self.pc_fallout_stats[pc_name] = {
-                    "minor_fallouts": 0, "major_fallouts": 0, "deaths": 0
-                }
-
-            for stat_type, amount in fallout_stats.items():
-                self.pc_fallout_stats[pc_name][stat_type] += amount
+        self.pc_attacks += combat_stats.pc_attacks
+        self.pc_hits += combat_stats.pc_hits
+        self.pc_damage += combat_stats.pc_damage
+        self.npc_attacks += combat_stats.npc_attacks
+        self.npc_hits += combat_stats.npc_hits
+        self.npc_damage += combat_stats.npc_damage
+        self.pc_damage_by_type += combat_stats.pc_damage_by_type
+        self.pc_minor_fallouts += combat_stats.pc_minor_fallouts
+        self.pc_major_fallouts += combat_stats.pc_major_fallouts
+        self.pc_deaths += combat_stats.pc_deaths
+
+    @property
+    def pc_stats(self) -> Dict[str, Dict[str, int]]:
+        """PC attack statistics keyed by name."""
+        pc_stats = defaultdict(_attack_counters)
+        for p, pc_name in enumerate(self.pc_names):
+            pc_stats[pc_name]["attacks"] += int(self.pc_attacks[p])
+            pc_stats[pc_name]["hits"] += int(self.pc_hits[p])
+            pc_stats[pc_name]["damage"] += int(self.pc_damage[p])
+        return pc_stats
+
+    @property
+    def npc_stats(self) -> Dict[str, Dict[str, int]]:
+        """NPC attack statistics keyed by name."""
+        npc_stats = defaultdict(_attack_counters)
+        for n, npc_name in enumerate(self.npc_names):
+            npc_stats[npc_name]["attacks"] += int(self.npc_attacks[n])
+            npc_stats[npc_name]["hits"] += int(self.npc_hits[n])
+            npc_stats[npc_name]["damage"] += int(self.npc_damage[n])
+        return npc_stats
+
+    @property
+    def pc_damage_taken(self) -> Dict[str, Dict[str, int]]:
+        """PC damage received statistics keyed by name."""
+        pc_damage_taken = defaultdict(_damage_counters)
+        for p, pc_name in enumerate(self.pc_names):
+            for t, resistance_type in enumerate(RESISTANCE_TYPES):
+                pc_damage_taken[pc_name][resistance_type] += int(self.pc_damage_by_type[p, t])
+            pc_damage_taken[pc_name]["total"] += int(self.pc_damage_by_type[p].sum())
+        return pc_damage_taken
+
+    @property
+    def pc_fallout_stats(self) -> Dict[str, Dict[str, int]]:
+        """PC fallout statistics keyed by name."""
+        pc_fallout_stats = defaultdict(_fallout_counters)
+        for p, pc_name in enumerate(self.pc_names):
+            pc_fallout_stats[pc_name]["minor_fallouts"] += int(self.pc_minor_fallouts[p])
+            pc_fallout_stats[pc_name]["major_fallouts"] += int(self.pc_major_fallouts[p])
+            pc_fallout_stats[pc_name]["deaths"] += int(self.pc_deaths[p])
+        return pc_fallout_stats
 
     def print_summary(self) -> None:
-        """Print comprehensive simulation results."""
-        self._print_fight_summary()
-        self._print_pc_combat_stats()
-        self._print_pc_damage_stats()
-        self._print_pc_fallout_stats()
-        self._print_npc_stats()
-
-    def _print_fight_summary(self) -> None:
+        """Print comprehensive simulation results with a single write."""
+        out = io.StringIO()
+        self._print_fight_summary(out)
+        self._print_pc_combat_stats(out)
+        self._print_pc_damage_stats(out)
+        self._print_pc_fallout_stats(out)
+        self._print_npc_stats(out)
+        sys.stdout.write(out.getvalue())
+
+    def _print_fight_summary(self, out: TextIO) -> None:
         """Print overall fight statistics."""
-        print(f"\n=== SIMULATION SUMMARY ===")
-        print(f"Total fights: {self.total_fights}")
+        print(f"\n=== SIMULATION SUMMARY ===", file=out)
+        print(f"Total fights: {self.total_fights}", file=out)
         print(
-            f"PC victories: {self.pc_victories} ({self.pc_victories / self.total_fights * 100:.1f}%)"
+            f"PC victories: {self.pc_victories} ({self.pc_victories / self.total_fights * 100:.1f}%)",
+            file=out,
         )
         print(
-            f"NPC victories: {self.npc_victories} ({self.npc_victories / self.total_fights * 100:.1f}%)"
+            f"NPC victories: {self.npc_victories} ({self.npc_victories / self.total_fights * 100:.1f}%)",
+            file=out,
         )
-        print(f"Draws: {self.draws} ({self.draws / self.total_fights * 100:.1f}%)")
-        print(f"Average rounds per fight: {self.average_rounds:.1f}")
+        print(f"Draws: {self.draws} ({self.draws / self.total_fights * 100:.1f}%)", file=out)
+        print(f"Average rounds per fight: {self.average_rounds:.1f}", file=out)
 
-    def _print_pc_combat_stats(self) -> None:
+    def _print_pc_combat_stats(self, out: TextIO) -> None:
         """Print PC attack statistics."""
-        print(f"\n=== PC STATISTICS ===")
+        print(f"\n=== PC STATISTICS ===", file=out)
         for pc_name, stats in self.pc_stats.items():
             attacks = stats["attacks"]
             hits = stats["hits"]
@@ -172,35 +292,35 @@ class SimulationResults:
             hit_rate = (hits / attacks * 100) if attacks > 0 else 0
             avg_damage = damage / attacks if attacks > 0 else 0
 
-            print(f"{pc_name}:")
-            print(f"  Hit rate: {hit_rate:.1f}% ({hits:,}/{attacks:,})")
-            print(f"  Average damage per attack: {avg_damage:.2f}")
-            print(f"  Total damage dealt: {damage:,}")
+            print(f"{pc_name}:", file=out)
+            print(f"  Hit rate: {hit_rate:.1f}% ({hits:,}/{attacks:,})", file=out)
+            print(f"  Average damage per attack: {avg_damage:.2f}", file=out)
+            print(f"  Total damage dealt: {damage:,}", file=out)
 
-    def _print_pc_damage_stats(self) -> None:
+    def _print_pc_damage_stats(self, out: TextIO) -> None:
         """Print PC damage taken statistics."""
-        print(f"\n=== PC DAMAGE TAKEN ===")
+        print(f"\n=== PC DAMAGE TAKEN ===", file=out)
         for pc_name, damage_stats in self.pc_damage_taken.items():
-            print(f"{pc_name}:")
-            print(f"  Blood: {damage_stats['blood']:,}")
-            print(f"  Echo: {damage_stats['echo']:,}")
-            print(f"  Mind: {damage_stats['mind']:,}")
-            print(f"  Fortune: {damage_stats['fortune']:,}")
-            print(f"  Supplies: {damage_stats['supplies']:,}")
-            print(f"  Total: {damage_stats['total']:,}")
-
-    def _print_pc_fallout_stats(self) -> None:
+            print(f"{pc_name}:", file=out)
+            print(f"  Blood: {damage_stats['blood']:,}", file=out)
+            print(f"  Echo: {damage_stats['echo']:,}", file=out)
+            print(f"  Mind: {damage_stats['mind']:,}", file=out)
+            print(f"  Fortune: {damage_stats['fortune']:,}", file=out)
+            print(f"  Supplies: {damage_stats['supplies']:,}", file=out)
+            print(f"  Total: {damage_stats['total']:,}", file=out)
+
+    def _print_pc_fallout_stats(self, out: TextIO) -> None:
         """Print PC fallout statistics."""
-        print(f"\n=== PC FALLOUT STATISTICS ===")
+        print(f"\n=== PC FALLOUT STATISTICS ===", file=out)
         for pc_name, fallout_stats in self.pc_fallout_stats.items():
-            print(f"{pc_name}:")
-            print(f"  Minor fallouts: {fallout_stats['minor_fallouts']:,}")
-            print(f"  Major fallouts: {fallout_stats['major_fallouts']:,}")
-            print(f"  Deaths: {fallout_stats['deaths']:,}")
+            print(f"{pc_name}:", file=out)
+            print(f"  Minor fallouts: {fallout_stats['minor_fallouts']:,}", file=out)
+            print(f"  Major fallouts: {fallout_stats['major_fallouts']:,}", file=out)
+            print(f"  Deaths: {fallout_stats['deaths']:,}", file=out)
 
-    def _print_npc_stats(self) -> None:
+    def _print_npc_stats(self, out: TextIO) -> None:
         """Print NPC attack statistics."""
-        print(f"\n=== NPC STATISTICS ===")
+        print(f"\n=== NPC STATISTICS ===", file=out)
         for npc_name, stats in self.npc_stats.items():
             attacks = stats["attacks"]
             hits = stats["hits"]
@@ -209,73 +329,97 @@ class SimulationResults:
             hit_rate = (hits / attacks * 100) if attacks > 0 else 0
             avg_damage = damage / attacks if attacks > 0 else 0
 
-            print(f"{npc_name}:")
-            print(f"  Hit rate: {hit_rate:.1f}% ({hits:,}/{attacks:,})")
-            print(f"  Average damage per attack: {avg_damage:.2f}")
-            print(f"  Total damage dealt: {damage:,}")
+            print(f"{npc_name}:", file=out)
+            print(f"  Hit rate: {hit_rate:.1f}% ({hits:,}/{attacks:,})", file=out)
+            print(f"  Average damage per attack: {avg_damage:.2f}", file=out)
+            print(f"  Total damage dealt: {damage:,}", file=out)
+
+
+def build_domain_match(pcs: List[Player], npcs: List[NPC]) -> np.ndarray:
+    """Return a (PCs x NPCs) matrix telling whether a PC shares a domain with an NPC."""
+    domain_match = np.zeros((len(pcs), len(npcs)), dtype=bool)
+
+    for p, pc in enumerate(pcs):
+        pc_set = {name for name, has_domain in asdict(pc.domains).items() if has_domain}
+        for n, npc in enumerate(npcs):
+            domain_match[p, n] = not pc_set.isdisjoint(npc.domains)
+
+    return domain_match
 
 
 class CombatSimulator:
-    def __init__(self):
-        self.pcs: List[Player] = []
-        self.npcs: List[NPC] = []
-        self.stats = CombatStats()
-
-    def load_npcs(self, directory: str = "npc") -> List[NPC]:
-        """Load all NPC YAML files from the specified directory."""
-        npcs = []
-
-        if not os.path.exists(directory):
-            return npcs
-
-        for filename in os.listdir(directory):
-            if filename.endswith((".yaml", ".yml")):
-                filepath = os.path.join(directory, filename)
-                try:
-                    with open(filepath, "r", encoding="utf-8") as file:
-                        data = yaml.safe_load(file)
-                        if data:
-                            npc = NPC.from_dict(data)
-                            npcs.append(npc)
-                except (yaml.YAMLError, KeyError, TypeError) as e:
-                    print(f"Error loading {filepath}: {e}")
-                    continue
-
-        return npcs
+    def __init__(self, pcs: List[Player] = None, npcs: List[NPC] = None):
+        self.pcs: List[Player] = pcs if pcs is not None else []
+        self.npcs: List[NPC] = npcs if npcs is not None else []
+        self.domain_match: List[List[bool]] = build_domain_match(self.pcs, self.npcs).tolist()
+        self._reset_live_characters()
+        self.stats = self._new_stats()
+        self._rng = random.Random()
 
     def setup_combat(self, pcs: List[Player] = None, npcs: List[NPC] = None):
         """Initialize combat with provided PCs and NPCs, or load from files."""
-        if pcs is not None:
+        characters_changed = False
+
+        if pcs is not None and pcs is not self.pcs:
             self.pcs = pcs
+            characters_changed = True
 
-        if npcs is not None:
+        if npcs is not None and npcs is not self.npcs:
             self.npcs = npcs
+            characters_changed = True
 
-        self.stats = CombatStats()
+        # Lists edited in place keep their identity but may change length
+        if len(self.pcs) != self.stats.num_pcs or len(self.npcs) != self.stats.num_npcs:
+            characters_changed = True
 
-    def pc_attack(self, pc: Player, npc: NPC) -> int:
+        if characters_changed:
+            self.domain_match = build_domain_match(self.pcs, self.npcs).tolist()
+            self.stats = self._new_stats()
+        else:
+            self.stats.reset()
+
+        self._reset_live_characters()
+
+    def _reset_live_characters(self):
+        """Rebuild the live character index lists.
+
+        The first active_*_count entries of live_pc_idx / live_npc_idx are the
+        indices of characters still in the fight; defeated ones are swapped
+        past that boundary so a random target is a single randrange.
+        """
+        self.live_pc_idx: List[int] = [p for p, pc in enumerate(self.pcs) if not pc.is_dead()]
+        self.live_npc_idx: List[int] = [
+            n for n, npc in enumerate(self.npcs) if not npc.is_defeated()
+        ]
+        self.active_pc_count = len(self.live_pc_idx)
+        self.active_npc_count = len(self.live_npc_idx)
+        # Marks live_pc_idx slots whose PC fell during the current round
+        self.pc_slot_fallen: List[bool] = [False] * len(self.live_pc_idx)
+
+    def _new_stats(self) -> CombatStats:
+        """Create empty statistics sized for the current characters."""
+        return CombatStats(num_pcs=len(self.pcs), num_npcs=len(self.npcs))
+
+    def pc_attack(self, pc_idx: int, npc_idx: int) -> int:
         """Calculate attack success from PC to NPC using d10 system."""
-        dice_to_roll = []
+        pc = self.pcs[pc_idx]
+        randrange = self._rng.randrange
 
-        # Base d10 roll
-        dice_to_roll.append(random.randint(1, 10))
+        # Base d10 roll, keeping the highest die. Bonus dice cannot beat a
+        # natural 10, so they are only rolled while the highest is below that.
+        highest_roll = randrange(1, 11)
 
         # Bonus die for kill ability
-        if pc.abilities.kill:
-            dice_to_roll.append(random.randint(1, 10))
+        if highest_roll < 10 and pc.abilities.kill:
+            roll = randrange(1, 11)
+            if roll > highest_roll:
+                highest_roll = roll
 
         # Bonus die for matching domain
-        has_matching_domain = False
-        for domain_name, has_domain in vars(pc.domains).items():
-            if has_domain and domain_name in npc.domains:
-                has_matching_domain = True
-                break
-
-        if has_matching_domain:
-            dice_to_roll.append(random.randint(1, 10))
-
-        # Take highest roll
-        highest_roll = max(dice_to_roll)
+        if highest_roll < 10 and self.domain_match[pc_idx][npc_idx]:
+            roll = randrange(1, 11)
+            if roll > highest_roll:
+                highest_roll = roll
 
         # Hit on 6-10
         if highest_roll >= 6:
@@ -283,7 +427,7 @@ class CombatSimulator:
             if pc.weapon <= 0:
                 weapon_damage = 1  # Minimum damage on successful hit
             else:
-                weapon_damage = random.randint(1, pc.weapon)
+                weapon_damage = randrange(1, pc.weapon + 1)
 
             # Critical hit on roll of 10 - add +2 to weapon damage
             if highest_roll == 10:
@@ -294,91 +438,68 @@ class CombatSimulator:
             # Miss
             return 0
 
-    def npc_attack(self, npc: NPC, pc: Player) -> Dict[str, int]:
-        """Calculate damage from NPC to PC across resistance types."""
+    def npc_attack(self, npc: NPC, pc: Player) -> Tuple[int, int]:
+        """Calculate damage from NPC to PC.
+
+        Returns the index of the targeted resistance type and the damage dealt,
+        or _MISS on a miss.
+        """
+        rng = self._rng
+
         # Roll d10 for NPC attack - hits on 1-5
-        npc_roll = random.randint(1, 10)
+        npc_roll = rng.randrange(1, 11)
 
         if npc_roll <= 5:
             # NPC hits - deal weapon damage
             if npc.weapon <= 0:
                 base_damage = 1  # Minimum damage on successful hit
             else:
-                base_damage = random.randint(1, npc.weapon)
+                base_damage = rng.randrange(1, npc.weapon + 1)
 
             # Critical hit on roll of 1 - double damage
             if npc_roll == 1:
                 base_damage *= 2
         else:
-            # NPC misses
-            base_damage = 0
+            # NPC misses - no damage to any resistance type
+            return _MISS
+
+        # Simple distribution: focus on one random resistance type
+        return rng.randrange(len(RESISTANCE_TYPES)), base_damage
+
+    def apply_pc_damage(self, pc_idx: int, resistance_idx: int, damage: int):
+        """Apply damage to one of the PC's resistance types, checking for fallouts."""
+        if resistance_idx < 0:
+            return
+
+        pc = self.pcs[pc_idx]
+        stats = self.stats
+        resistance = pc.resistance.values
 
-        # Distribute damage across resistance types
-        resistance_types = ["blood", "echo", "mind", "fortune", "supplies"]
-        damage_distribution = {}
+        new_value = resistance[resistance_idx] + damage
 
-        if base_damage > 0:
-            # Simple distribution: focus on one random resistance type
-            target_resistance = random.choice(resistance_types)
-            damage_distribution[target_resistance] = base_damage
+        # Track damage received by type
+        stats.pc_damage_by_type[pc_idx][resistance_idx] += damage
+
+        # Below 12 stress just store the value, otherwise fall out
+        if new_value < 12:
+            resistance[resistance_idx] = new_value
         else:
-            # Miss - no damage to any resistance type
-            for resistance_type in resistance_types:
-                damage_distribution[resistance_type] = 0
-
-        return damage_distribution
-
-    def apply_pc_damage(self, pc: Player, damage_dist: Dict[str, int]):
-        """Apply damage to PC's resistance, checking for fallouts."""
-        pc_name = pc.name
-        if pc_name not in self.stats.pc_damage_received:
-            self.stats.pc_damage_received[pc_name] = {
-                "blood": 0,
-                "echo": 0,
-                "mind": 0,
-                "fortune": 0,
-                "supplies": 0,
-                "total": 0,
-            }
-
-        if pc_name not in self.stats.pc_fallouts:
-            self.stats.pc_fallouts[pc_name] = {
-                "minor_fallouts": 0,
-                "major_fallouts": 0,
-                "deaths": 0,
-            }
-
-        for resistance_type, damage in damage_dist.items():
-            current_value = getattr(pc.resistance, resistance_type)
-            new_value = min(12, current_value + damage)
-            setattr(pc.resistance, resistance_type, new_value)
-
-            # Track damage received by type
-            self.stats.pc_damage_received[pc_name][resistance_type] += damage
-            self.stats.pc_damage_received[pc_name]["total"] += damage
-
-            # Check for fallout at 12 stress
-            if new_value >= 12:
-                # Minor fallout - reset resistance to 0
-                setattr(pc.resistance, resistance_type, 0)
-                pc.minor_fallouts += 1
-                self.stats.pc_fallouts[pc_name]["minor_fallouts"] += 1
-
-                # Check for major fallout (every 2 minor fallouts)
-                if pc.minor_fallouts % 2 == 0:
-                    pc.major_fallouts += 1
-                    self.stats.pc_fallouts[pc_name]["major_fallouts"] += 1
-
-                    # Major fallout - clear all stress
-                    pc.resistance.blood = 0
-                    pc.resistance.echo = 0
-                    pc.resistance.mind = 0
-                    pc.resistance.fortune = 0
-                    pc.resistance.supplies = 0
-
-                    # Check for death (at 2 major fallouts)
-                    if pc.is_dead():
-                        self.stats.pc_fallouts[pc_name]["deaths"] += 1
+            # Minor fallout - reset resistance to 0
+            resistance[resistance_idx] = 0
+            pc.minor_fallouts += 1
+            stats.pc_minor_fallouts[pc_idx] += 1
+
+            # Check for major fallout (every 2 minor fallouts)
+            if pc.minor_fallouts % 2 == 0:
+                pc.major_fallouts += 1
+                stats.pc_major_fallouts[pc_idx] += 1
+
+                # Major fallout - clear all stress
+                pc.resistance.clear()
+
+                # Check for death (at 2 major fallouts)
+                if pc.is_dead():
+                    stats.pc_deaths[pc_idx] += 1
 
     def is_pc_defeated(self, pc: Player) -> bool:
         """Check if PC is defeated (dead from 2 major fallouts)."""
@@ -388,77 +509,93 @@ class CombatSimulator:
         """Execute one round of combat."""
         self.stats.rounds += 1
 
-        # PCs attack NPCs
-        active_pcs = [pc for pc in self.pcs if not self.is_pc_defeated(pc)]
-        active_npcs = [npc for npc in self.npcs if not npc.is_defeated()]
-
-        for pc in active_pcs:
-            if active_npcs:
-                target_npc = random.choice(active_npcs)
-                damage = self.pc_attack(pc, target_npc)
-
-                # Track individual PC statistics
-                pc_name = pc.name
-                if pc_name not in self.stats.pc_individual_stats:
-                    self.stats.pc_individual_stats[pc_name] = {
-                        "attacks": 0,
-                        "hits": 0,
-                        "damage": 0,
-                    }
-
-                self.stats.pc_individual_stats[pc_name]["attacks"] += 1
-                if damage > 0:
-                    self.stats.pc_individual_stats[pc_name]["hits"] += 1
-                self.stats.pc_individual_stats[pc_name]["damage"] += damage
-
-                target_npc.take_damage(damage)
-                self.stats.total_damage_to_npcs += damage
-
-                if target_npc.is_defeated():
-                    self.stats.npc_defeats += 1
-                    active_npcs.remove(target_npc)
-
-        # NPCs attack PCs
-        for npc in active_npcs:
-            if active_pcs:
-                target_pc = random.choice(active_pcs)
-                damage_dist = self.npc_attack(npc, target_pc)
-                self.apply_pc_damage(target_pc, damage_dist)
+        stats = self.stats
+        pcs = self.pcs
+        npcs = self.npcs
+        live_pc_idx = self.live_pc_idx
+        live_npc_idx = self.live_npc_idx
+        randrange = self._rng.randrange
+        pc_attacks, pc_hits, pc_damage = stats.pc_attacks, stats.pc_hits, stats.pc_damage
+        npc_attacks, npc_hits, npc_damage = stats.npc_attacks, stats.npc_hits, stats.npc_damage
 
-                total_damage = sum(damage_dist.values())
-
-                # Track individual NPC statistics
-                npc_name = npc.name
-                if npc_name not in self.stats.npc_individual_stats:
-                    self.stats.npc_individual_stats[npc_name] = {
-                        "attacks": 0,
-                        "hits": 0,
-                        "damage": 0,
-                    }
-
-                self.stats.npc_individual_stats[npc_name]["attacks"] += 1
-                if total_damage > 0:
-                    self.stats.npc_individual_stats[npc_name]["hits"] += 1
-                self.stats.npc_individual_stats[npc_name]["damage"] += total_damage
-
-                self.stats.total_damage_to_pcs += total_damage
+        # PCs attack NPCs
+        for p, pc in enumerate(pcs):
+            if pc.is_dead():
+                continue
+            if self.active_npc_count == 0:
+                break
 
-                if self.is_pc_defeated(target_pc):
-                    self.stats.pc_defeats += 1
+            i = randrange(self.active_npc_count)
+            target_idx = live_npc_idx[i]
+            target_npc = npcs[target_idx]
+            damage = self.pc_attack(p, target_idx)
+
+            # Track individual PC statistics
+            pc_attacks[p] += 1
+            if damage > 0:
+                pc_hits[p] += 1
+            pc_damage[p] += damage
+
+            target_npc.take_damage(damage)
+
+            if target_npc.is_defeated():
+                stats.npc_defeats += 1
+                self.active_npc_count -= 1
+                last = self.active_npc_count
+                live_npc_idx[i], live_npc_idx[last] = live_npc_idx[last], target_idx
+
+        if self.active_pc_count == 0:
+            return
+
+        # NPCs attack PCs that were standing at the start of the round
+        slot_fallen = self.pc_slot_fallen
+        any_fallen = False
+        for n, npc in enumerate(npcs):
+            if npc.is_defeated():
+                continue
+
+            i = randrange(self.active_pc_count)
+            target_idx = live_pc_idx[i]
+            target_pc = pcs[target_idx]
+            resistance_idx, damage = self.npc_attack(npc, target_pc)
+            self.apply_pc_damage(target_idx, resistance_idx, damage)
+
+            # Track individual NPC statistics
+            npc_attacks[n] += 1
+            if damage > 0:
+                npc_hits[n] += 1
+            npc_damage[n] += damage
+
+            if self.is_pc_defeated(target_pc):
+                stats.pc_defeats += 1
+                slot_fallen[i] = True
+                any_fallen = True
+
+        if not any_fallen:
+            return
+
+        # PCs that fell this round leave the fight. Walking slots from the back
+        # means every slot swapped down from the end is already known standing.
+        for i in range(self.active_pc_count - 1, -1, -1):
+            if slot_fallen[i]:
+                slot_fallen[i] = False
+                self.active_pc_count -= 1
+                last = self.active_pc_count
+                live_pc_idx[i], live_pc_idx[last] = live_pc_idx[last], live_pc_idx[i]
 
     def is_combat_over(self) -> bool:
         """Check if combat should end."""
-        active_pcs = [pc for pc in self.pcs if not self.is_pc_defeated(pc)]
-        active_npcs = [npc for npc in self.npcs if not npc.is_defeated()]
+        return self.active_pc_count == 0 or self.active_npc_count == 0
 
-        return len(active_pcs) == 0 or len(active_npcs) == 0
+    def reset_characters(self):
+        """Reset all characters in place for a new fight.
 
-    def reset_characters(self, original_pcs: List[Player], original_npcs: List[NPC]):
-        """Reset all characters to their original state for a new fight."""
-        # Deep copy to reset resistance values
-        self.pcs = copy.deepcopy(original_pcs)
-        self.npcs = copy.deepcopy(original_npcs)
-        self.stats = CombatStats()
+        Combat stats are zeroed by setup_combat when the fight starts.
+        """
+        for pc in self.pcs:
+            pc.reset()
+        for npc in self.npcs:
+            npc.reset()
 
     def simulate_single_combat(
         self,
@@ -483,11 +620,8 @@ class CombatSimulator:
             self.print_combat_results()
 
         # Determine winners
-        active_pcs = [pc for pc in self.pcs if not self.is_pc_defeated(pc)]
-        active_npcs = [npc for npc in self.npcs if not npc.is_defeated()]
-
-        pc_won = len(active_pcs) > 0 and len(active_npcs) == 0
-        npc_won = len(active_npcs) > 0 and len(active_pcs) == 0
+        pc_won = self.active_pc_count > 0 and self.active_npc_count == 0
+        npc_won = self.active_npc_count > 0 and self.active_pc_count == 0
 
         return pc_won, npc_won, self.stats.rounds
 
@@ -497,34 +631,42 @@ class CombatSimulator:
         npcs: List[NPC] = None,
         config: SimulationConfig = None,
     ) -> SimulationResults:
-        """Run multiple combat simulations and collect statistics."""
+        """Run multiple combat simulations and collect statistics.
+
+        The given Player and NPC objects are fought with directly and reset in
+        place between fights, so they come back mutated: stress, fallouts and
+        NPC resistance hold the state at the end of the last fight.
+        """
         if config is None:
             config = SimulationConfig()
 
-        # Load characters if not provided
+        # Use the simulator's characters if none are given, load them as a last resort
         if pcs is None:
-            pcs = get_all_players()
+            pcs = self.pcs or get_all_players()
         if npcs is None:
-            npcs = self.load_npcs()
+            npcs = self.npcs or load_npcs()
 
         if not pcs or not npcs:
             print("No PCs or NPCs found for simulation!")
             return SimulationResults()
 
-        # Store original character states
-        original_pcs = copy.deepcopy(pcs)
-        original_npcs = copy.deepcopy(npcs)
+        # Characters are reset in place between fights
+        self.setup_combat(pcs, npcs)
 
-        results = SimulationResults()
+        results = SimulationResults(
+            pc_names=[pc.name for pc in pcs], npc_names=[npc.name for npc in npcs]
+        )
 
         print(f"Running {config.number_of_fights:,} combat simulations...")
 
+        log_progress = logging.getLogger().isEnabledFor(logging.INFO)
+
         for fight_num in range(config.number_of_fights):
-            if (fight_num + 1) % 1000 == 0:
-                print(f"Completed {fight_num + 1:,} fights...")
+            if log_progress and (fight_num + 1) % 1000 == 0:
+                logging.info(f"Completed {fight_num + 1:,} fights...")
 
             # Reset characters for new fight
-            self.reset_characters(original_pcs, original_npcs)
+            self.reset_characters()
 
             # Run single combat
             pc_won, npc_won, rounds = self.simulate_single_combat(
@@ -540,47 +682,335 @@ class CombatSimulator:
 
     def print_combat_results(self):
         """Print final combat statistics."""
-        print(f"\n=== COMBAT RESULTS ===")
-        print(f"Rounds fought: {self.stats.rounds}")
-        print(f"PCs defeated: {self.stats.pc_defeats}")
-        print(f"NPCs defeated: {self.stats.npc_defeats}")
-        print(f"Total damage to PCs: {self.stats.total_damage_to_pcs}")
-        print(f"Total damage to NPCs: {self.stats.total_damage_to_npcs}")
+        out = io.StringIO()
+        print(f"\n=== COMBAT RESULTS ===", file=out)
+        print(f"Rounds fought: {self.stats.rounds}", file=out)
+        print(f"PCs defeated: {self.stats.pc_defeats}", file=out)
+        print(f"NPCs defeated: {self.stats.npc_defeats}", file=out)
+        print(f"Total damage to PCs: {self.stats.total_damage_to_pcs}", file=out)
+        print(f"Total damage to NPCs: {self.stats.total_damage_to_npcs}", file=out)
 
         active_pcs = [pc for pc in self.pcs if not self.is_pc_defeated(pc)]
         active_npcs = [npc for npc in self.npcs if not npc.is_defeated()]
 
         if active_pcs and not active_npcs:
-            print("PCs VICTORY!")
+            print("PCs VICTORY!", file=out)
         elif active_npcs and not active_pcs:
-            print("NPCs VICTORY!")
+            print("NPCs VICTORY!", file=out)
         else:
-            print("DRAW!")
+            print("DRAW!", file=out)
 
-        print(f"\nSurviving PCs: {len(active_pcs)}")
+        print(f"\nSurviving PCs: {len(active_pcs)}", file=out)
         for pc in active_pcs:
             print(
                 f"  {pc.name}: Blood {pc.resistance.blood}, Echo {pc.resistance.echo}, "
                 f"Mind {pc.resistance.mind}, Fortune {pc.resistance.fortune}, "
-                f"Supplies {pc.resistance.supplies}"
+                f"Supplies {pc.resistance.supplies}",
+                file=out,
             )
 
-        print(f"\nSurviving NPCs: {len(active_npcs)}")
+        print(f"\nSurviving NPCs: {len(active_npcs)}", file=out)
         for npc in active_npcs:
-            print(f"  {npc.name}: {npc.resistance}/{npc.max_resistance} resistance")
+            print(f"  {npc.name}: {npc.resistance}/{npc.max_resistance} resistance", file=out)
+
+        sys.stdout.write(out.getvalue())
+
+
+def _pick_kth_living(standing: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Return, per fight (row), the column index of the k-th (0-based) standing character.
+
+    Rows with nobody standing come back as 0; callers mask those fights out.
+    """
+    return np.argmax(np.cumsum(standing, axis=1) > k[:, None], axis=1)
+
+
+def _run_fights(
+    pc_weapon: np.ndarray,
+    pc_starting_stress: np.ndarray,
+    pc_kill: np.ndarray,
+    pc_domain_match: np.ndarray,
+    npc_weapon: np.ndarray,
+    npc_protection: np.ndarray,
+    npc_max_res: np.ndarray,
+    num_fights: int,
+    max_rounds: int,
+    seed: np.random.SeedSequence = None,
+) -> Dict[str, np.ndarray]:
+    """Simulate a batch of fights on plain arrays and return summed counters.
+
+    Pure function of its arguments: all character state lives in typed arrays
+    local to the call, so batches can be run independently and added together.
+    """
+    rng = np.random.default_rng(seed)
+    num_pcs = len(pc_weapon)
+    num_npcs = len(npc_weapon)
+    num_types = len(RESISTANCE_TYPES)
+    fights = np.arange(num_fights)
+
+    # Per-fight character state
+    npc_res = np.tile(npc_max_res.astype(np.int16), (num_fights, 1))
+    pc_stress = np.tile(pc_starting_stress.astype(np.int8), (num_fights, 1, 1))
+    pc_minor = np.zeros((num_fights, num_pcs), dtype=np.int16)
+    pc_major = np.zeros((num_fights, num_pcs), dtype=np.int16)
+    rounds = np.zeros(num_fights, dtype=np.int64)
+    in_progress = np.ones(num_fights, dtype=bool)
+
+    # Accumulated statistics
+    pc_attacks = np.zeros(num_pcs, dtype=np.int64)
+    pc_hits = np.zeros(num_pcs, dtype=np.int64)
+    pc_damage = np.zeros(num_pcs, dtype=np.int64)
+    npc_attacks = np.zeros(num_npcs, dtype=np.int64)
+    npc_hits = np.zeros(num_npcs, dtype=np.int64)
+    npc_damage = np.zeros(num_npcs, dtype=np.int64)
+    pc_damage_by_type = np.zeros((num_pcs, num_types), dtype=np.int64)
+    pc_minor_total = np.zeros(num_pcs, dtype=np.int64)
+    pc_major_total = np.zeros(num_pcs, dtype=np.int64)
+    pc_deaths = np.zeros(num_pcs, dtype=np.int64)
+
+    for _ in range(max_rounds):
+        if not in_progress.any():
+            break
+        rounds += in_progress
+
+        # PCs attack NPCs
+        pc_standing = in_progress[:, None] & (pc_major < 2)
+        npc_standing = npc_res > 0
+
+        # Roll every PC's dice for the round up front as int8 rows, one
+        # contiguous row of fights per die; a zeroed die never wins the max,
+        # so that is how bonus dice are masked
+        pc_dice = rng.integers(1, 11, size=(num_pcs, 3, num_fights), dtype=np.int8)
+        pc_dice[:, 1] *= pc_kill[:, None]
+
+        for p in range(num_pcs):
+            live_count = npc_standing.sum(axis=1)
+            attacking = pc_standing[:, p] & (live_count > 0)
+
+            # Pick the k-th living NPC uniformly at random
+            k = (rng.random(num_fights) * live_count).astype(np.int64)
+            target = _pick_kth_living(npc_standing, k)
+
+            dice = pc_dice[p]
+            dice[2] *= pc_domain_match[p, target]
+            highest = np.maximum(np.maximum(dice[0], dice[1]), dice[2])
+            crit = highest == 10
+
+            hit = attacking & (highest >= 6)
+            if pc_weapon[p] <= 0:
+                damage = np.ones(num_fights, dtype=np.int64)
+            else:
+                damage = rng.integers(1, pc_weapon[p] + 1, size=num_fights)
+            damage = np.where(hit, damage + crit * 2, 0)
+
+            pc_attacks[p] += attacking.sum()
+            pc_hits[p] += hit.sum()
+            pc_damage[p] += damage.sum()
+
+            actual = np.maximum(0, damage - npc_protection[target])
+            npc_res[fights, target] = np.maximum(0, npc_res[fights, target] - actual)
+            npc_standing[fights, target] = npc_res[fights, target] > 0
+
+        # NPCs attack PCs
+        pc_live_count = pc_standing.sum(axis=1)
+
+        for n in range(num_npcs):
+            attacking = npc_standing[:, n] & (pc_live_count > 0)
+
+            k = (rng.random(num_fights) * pc_live_count).astype(np.int64)
+            target = _pick_kth_living(pc_standing, k)
+
+            roll = rng.integers(1, 11, size=num_fights)
+            hit = attacking & (roll <= 5)
+            if npc_weapon[n] <= 0:
+                damage = np.ones(num_fights, dtype=np.int64)
+            else:
+                damage = rng.integers(1, npc_weapon[n] + 1, size=num_fights)
+            damage = np.where(hit, damage * np.where(roll == 1, 2, 1), 0)
+            resistance_type = rng.integers(0, num_types, size=num_fights)
+
+            npc_attacks[n] += attacking.sum()
+            npc_hits[n] += hit.sum()
+            npc_damage[n] += damage.sum()
+            pc_damage_by_type += np.bincount(
+                target * num_types + resistance_type, weights=damage, minlength=num_pcs * num_types
+            ).astype(np.int64).reshape(num_pcs, num_types)
+
+            stress = np.minimum(12, pc_stress[fights, target, resistance_type] + damage)
+
+            # Minor fallout when a hit reaches 12 stress, every second one is a major fallout.
+            # Gated on hit: a PC loaded at 12 stress only falls out once actually hit.
+            minor = hit & (stress >= 12)
+            stress[minor] = 0
+            pc_stress[fights, target, resistance_type] = stress
+            pc_minor[fights, target] += minor
+            major = minor & (pc_minor[fights, target] % 2 == 0)
+            pc_major[fights, target] += major
+            pc_stress[fights[major], target[major]] = 0
+            death = major & (pc_major[fights, target] >= 2)
+
+            pc_minor_total += np.bincount(target[minor], minlength=num_pcs)
+            pc_major_total += np.bincount(target[major], minlength=num_pcs)
+            pc_deaths += np.bincount(target[death], minlength=num_pcs)
+
+        pcs_alive = (pc_major < 2).any(axis=1)
+        npcs_alive = (npc_res > 0).any(axis=1)
+        in_progress &= pcs_alive & npcs_alive
+
+    pcs_alive = (pc_major < 2).any(axis=1)
+    npcs_alive = (npc_res > 0).any(axis=1)
+
+    return {
+        "pc_victories": np.sum(pcs_alive & ~npcs_alive),
+        "npc_victories": np.sum(npcs_alive & ~pcs_alive),
+        "total_rounds": rounds.sum(),
+        "pc_attacks": pc_attacks,
+        "pc_hits": pc_hits,
+        "pc_damage": pc_damage,
+        "npc_attacks": npc_attacks,
+        "npc_hits": npc_hits,
+        "npc_damage": npc_damage,
+        "pc_damage_by_type": pc_damage_by_type,
+        "pc_minor_fallouts": pc_minor_total,
+        "pc_major_fallouts": pc_major_total,
+        "pc_deaths": pc_deaths,
+    }
+
+
+# Largest batch of fights one call of _run_fights simulates, bounding its memory
+MAX_FIGHTS_PER_BATCH = 50_000
+# Smallest batch worth shipping to a worker process
+MIN_FIGHTS_PER_BATCH = 2_000
+
+
+def _run_fights_parallel(
+    num_fights: int, max_rounds: int, workers: int, **character_arrays: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Split fights into batches, run them across processes and sum.
+
+    There is at least one batch per worker, as long as each stays at least
+    MIN_FIGHTS_PER_BATCH fights, and no batch exceeds MAX_FIGHTS_PER_BATCH so
+    memory per worker does not grow with the total fight count. Results are
+    summed as they arrive.
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    num_batches = max(
+        1,
+        min(workers, num_fights // MIN_FIGHTS_PER_BATCH),
+        -(-num_fights // MAX_FIGHTS_PER_BATCH),
+    )
+
+    seeds = np.random.SeedSequence().spawn(num_batches)
+    batches = [
+        (num_fights // num_batches + (1 if i < num_fights % num_batches else 0), seed)
+        for i, seed in enumerate(seeds)
+    ]
+    run_fights = partial(_run_fights, max_rounds=max_rounds, **character_arrays)
+    run_batch = partial(_run_fights_batch, run_fights)
+
+    workers = min(workers, num_batches)
+    if workers == 1:
+        return _sum_batches(map(run_batch, batches))
+
+    with multiprocessing.Pool(workers) as pool:
+        return _sum_batches(pool.imap_unordered(run_batch, batches))
+
+
+def _run_fights_batch(
+    run_fights, batch: Tuple[int, np.random.SeedSequence]
+) -> Dict[str, np.ndarray]:
+    """Pool entry point for one (num_fights, seed) batch of fights."""
+    num_fights, seed = batch
+    return run_fights(num_fights=num_fights, seed=seed)
+
+
+def _sum_batches(partials) -> Dict[str, np.ndarray]:
+    """Accumulate per-batch totals as each batch finishes."""
+    totals = next(partials)
+    for batch_totals in partials:
+        for key, value in batch_totals.items():
+            totals[key] += value
+    return totals
+
+
+def simulate_vectorized(
+    pcs: List[Player] = None, npcs: List[NPC] = None, config: SimulationConfig = None
+) -> SimulationResults:
+    """Run all fights at once, vectorized over the fight axis with NumPy.
+
+    Follows the same rules as CombatSimulator: every round each PC that was
+    standing at the start of the round attacks a random living NPC, then every
+    NPC still standing attacks a random PC that was standing at round start.
+    """
+    if config is None:
+        config = SimulationConfig()
+
+    if pcs is None:
+        pcs = get_all_players()
+    if npcs is None:
+        npcs = load_npcs()
+
+    if not pcs or not npcs:
+        print("No PCs or NPCs found for simulation!")
+        return SimulationResults()
+
+    print(f"Running {config.number_of_fights:,} combat simulations...")
+
+    # Character attributes as structure-of-arrays
+    totals = _run_fights_parallel(
+        num_fights=config.number_of_fights,
+        max_rounds=config.max_rounds_per_fight,
+        workers=config.workers,
+        pc_weapon=np.array([pc.weapon for pc in pcs], dtype=np.int16),
+        pc_starting_stress=np.array([pc.starting_resistance for pc in pcs], dtype=np.int8),
+        pc_kill=np.array([pc.abilities.kill for pc in pcs], dtype=bool),
+        pc_domain_match=build_domain_match(pcs, npcs),
+        npc_weapon=np.array([npc.weapon for npc in npcs], dtype=np.int16),
+        npc_protection=np.array([npc.protection for npc in npcs], dtype=np.int16),
+        npc_max_res=np.array([npc.max_resistance for npc in npcs], dtype=np.int16),
+    )
+
+    num_fights = config.number_of_fights
+    pc_victories = int(totals.pop("pc_victories"))
+    npc_victories = int(totals.pop("npc_victories"))
+    total_rounds = int(totals.pop("total_rounds"))
+    results = SimulationResults(
+        total_fights=num_fights,
+        pc_victories=pc_victories,
+        npc_victories=npc_victories,
+        draws=num_fights - pc_victories - npc_victories,
+        average_rounds=total_rounds / num_fights,
+        total_rounds=total_rounds,
+        pc_names=[pc.name for pc in pcs],
+        npc_names=[npc.name for npc in npcs],
+        **totals,
+    )
+
+    if config.show_detailed_results:
+        results.print_summary()
+
+    return results
 
 
 def run_combat_simulation(
     pcs: List[Player] = None, npcs: List[NPC] = None, config: SimulationConfig = None
 ):
     """Main function to run combat simulation."""
-    simulator = CombatSimulator()
+    if pcs is None:
+        pcs = get_all_players()
+    if npcs is None:
+        npcs = load_npcs()
+
+    if config and config.number_of_fights > 1 and not config.verbose_output:
+        return simulate_vectorized(pcs, npcs, config)
+
+    simulator = CombatSimulator(pcs, npcs)
 
     if config and config.number_of_fights > 1:
-        return simulator.simulate_multiple_combats(pcs, npcs, config)
+        return simulator.simulate_multiple_combats(config=config)
     else:
         # Single combat for backwards compatibility
-        pc_won, npc_won, rounds = simulator.simulate_single_combat(pcs, npcs)
+        pc_won, npc_won, rounds = simulator.simulate_single_combat()
         return pc_won, npc_won, rounds
 
 
@@ -9,6 +9,7 @@ class SimulationConfig:
     max_rounds_per_fight: int = 20
     verbose_output: bool = False
     show_detailed_results: bool = True
+    workers: int = 0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SimulationConfig':
@@ -17,7 +18,8 @@ class SimulationConfig:
             number_of_fights=simulation_data.get('number_of_fights', 1000),
             max_rounds_per_fight=simulation_data.get('max_rounds_per_fight', 20),
             verbose_output=simulation_data.get('verbose_output', False),
-            show_detailed_results=simulation_data.get('show_detailed_results', True)
+            show_detailed_results=simulation_data.get('show_detailed_results', True),
+            workers=simulation_data.get('workers', 0)
         )
 
 
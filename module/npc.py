@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import FrozenSet, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     name: str
     weapon: int
-    domains: List[str]
+    domains: FrozenSet[str]
     resistance: int
     protection: int
     max_resistance: int = field(init=False)
@@ -19,11 +19,14 @@ class NPC:
         return cls(
             name=data["name"],
             weapon=data["weapon"],
-            domains=data["domains"],
+            domains=frozenset(data["domains"]),
             resistance=data["resistance"],
             protection=data["protection"],
         )
 
+    def reset(self):
+        self.resistance = self.max_resistance
+
     def is_defeated(self) -> bool:
         return self.resistance <= 0
 
@@ -1,8 +1,9 @@
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAbilities:
     compel: bool = False
     delve: bool = False
@@ -15,7 +16,7 @@ class PlayerAbilities:
     sneak: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerDomains:
     cursed: bool = False
     desolate: bool = False
@@ -27,25 +28,45 @@ class PlayerDomains:
     wild: bool = False
 
 
-@dataclass
+RESISTANCE_TYPES = ["blood", "echo", "mind", "fortune", "supplies"]
+RESISTANCE_INDEX = {name: index for index, name in enumerate(RESISTANCE_TYPES)}
+_NO_STRESS = array("b", [0] * len(RESISTANCE_TYPES))
+
+
+def _resistance_property(index: int) -> property:
+    def getter(self) -> int:
+        return self.values[index]
+
+    def setter(self, value: int):
+        self.values[index] = value
+
+    return property(getter, setter)
+
+
+@dataclass(slots=True, init=False)
 class PlayerResistance:
-    blood: int = 0
-    echo: int = 0
-    mind: int = 0
-    fortune: int = 0
-    supplies: int = 0
+    # Stress per resistance type as signed bytes, indexed like RESISTANCE_TYPES
+    values: array
 
-    def __post_init__(self):
+    def __init__(
+        self, blood: int = 0, echo: int = 0, mind: int = 0, fortune: int = 0, supplies: int = 0
+    ):
         # Ensure resistance values are between 0 and 12
-        for field in ["blood", "echo", "mind", "fortune", "supplies"]:
-            value = getattr(self, field)
-            if value < 0:
-                setattr(self, field, 0)
-            elif value > 12:
-                setattr(self, field, 12)
+        self.values = array(
+            "b", [min(12, max(0, value)) for value in (blood, echo, mind, fortune, supplies)]
+        )
+
+    blood = _resistance_property(RESISTANCE_INDEX["blood"])
+    echo = _resistance_property(RESISTANCE_INDEX["echo"])
+    mind = _resistance_property(RESISTANCE_INDEX["mind"])
+    fortune = _resistance_property(RESISTANCE_INDEX["fortune"])
+    supplies = _resistance_property(RESISTANCE_INDEX["supplies"])
+
+    def clear(self):
+        self.values[:] = _NO_STRESS
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     player_class: str
@@ -56,10 +77,20 @@ class Player:
     resistance: PlayerResistance
     minor_fallouts: int = 0
     major_fallouts: int = 0
+    # Stress values the PC was loaded with, restored before every fight
+    starting_resistance: array = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.starting_resistance = array("b", self.resistance.values)
     
     def is_dead(self) -> bool:
         return self.major_fallouts >= 2
 
+    def reset(self):
+        self.resistance.values[:] = self.starting_resistance
+        self.minor_fallouts = 0
+        self.major_fallouts = 0
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Player":
         abilities_data = data.get("abilities", {})
@@ -1,31 +1,82 @@
 import os
+import copy
 import yaml
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
+from module.npc import NPC
 from module.player import Player
 
+# Use libyaml's C loader when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed files keyed by path, stored with the modification time they were read at
+_yaml_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+def load_yaml(filepath: str, mtime: Optional[int] = None) -> Any:
+    """Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    Callers that already stat'ed the file (e.g. through os.scandir) can pass its
+    st_mtime_ns to skip another stat. Each caller gets its own copy, so
+    mutating the result never touches the cache.
+    """
+    if mtime is None:
+        mtime = os.stat(filepath).st_mtime_ns
+    cached = _yaml_cache.get(filepath)
+    if cached is None or cached[0] != mtime:
+        with open(filepath, "r", encoding="utf-8") as file:
+            data = yaml.load(file, Loader=SafeLoader)
+        cached = _yaml_cache[filepath] = (mtime, data)
+
+    return copy.deepcopy(cached[1])
+
 
 def load_yaml_files(directory: str = "pc") -> List[Player]:
     players = []
 
-    if not os.path.exists(directory):
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
         return players
 
-    for filename in os.listdir(directory):
-        if filename.endswith((".yaml", ".yml")):
-            filepath = os.path.join(directory, filename)
-            try:
-                with open(filepath, "r", encoding="utf-8") as file:
-                    data = yaml.safe_load(file)
+    with entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith((".yaml", ".yml")):
+                try:
+                    data = load_yaml(entry.path, entry.stat().st_mtime_ns)
                     if data:  # Skip empty files
                         player = Player.from_dict(data)
                         players.append(player)
-            except (yaml.YAMLError, KeyError, TypeError) as e:
-                print(f"Error loading {filepath}: {e}")
-                continue
+                except (yaml.YAMLError, KeyError, TypeError) as e:
+                    print(f"Error loading {entry.path}: {e}")
+                    continue
 
     return players
 
 
+def load_npcs(directory: str = "npc") -> List[NPC]:
+    """Load all NPC YAML files from the specified directory."""
+    npcs = []
+
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return npcs
+
+    with entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith((".yaml", ".yml")):
+                try:
+                    data = load_yaml(entry.path, entry.stat().st_mtime_ns)
+                    if data:
+                        npc = NPC.from_dict(data)
+                        npcs.append(npc)
+                except (yaml.YAMLError, KeyError, TypeError) as e:
+                    print(f"Error loading {entry.path}: {e}")
+                    continue
+
+    return npcs
+
+
 def get_all_players() -> List[Player]:
     """Convenience function to load all players from the default pc/ directory."""
     return load_yaml_files()
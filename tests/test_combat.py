@@ -0,0 +1,213 @@
+import numpy as np
+import pytest
+
+from module.combat import (
+    CombatSimulator,
+    _pick_kth_living,
+    build_domain_match,
+    simulate_vectorized,
+)
+from module.config import SimulationConfig
+from module.npc import NPC
+from module.player import Player, PlayerAbilities, PlayerDomains, PlayerResistance
+
+
+def make_pcs(weapon=6):
+    return [
+        Player(
+            name="Cleaver",
+            player_class="Cleaver",
+            calling="Enlightenment",
+            abilities=PlayerAbilities(kill=True),
+            domains=PlayerDomains(cursed=True),
+            weapon=weapon,
+            resistance=PlayerResistance(),
+        ),
+        Player(
+            name="Deadwalker",
+            player_class="Deadwalker",
+            calling="Penitent",
+            abilities=PlayerAbilities(delve=True),
+            domains=PlayerDomains(occult=True, wild=True),
+            weapon=weapon,
+            resistance=PlayerResistance(blood=4, mind=2),
+        ),
+    ]
+
+
+def make_npcs(protection=1):
+    return [
+        NPC(name="Guard", weapon=8, domains=frozenset({"religion"}), resistance=22, protection=protection),
+        NPC(name="Guard", weapon=8, domains=frozenset({"religion"}), resistance=22, protection=protection),
+        NPC(name="Priest", weapon=10, domains=frozenset({"cursed"}), resistance=24, protection=protection),
+    ]
+
+
+def make_config(fights, max_rounds=20):
+    return SimulationConfig(
+        number_of_fights=fights,
+        max_rounds_per_fight=max_rounds,
+        verbose_output=False,
+        show_detailed_results=False,
+        workers=1,
+    )
+
+
+def run_both(config, pc_weapon=6, npc_protection=1):
+    """Run the same setup through the scalar and the vectorized simulator."""
+    simulator = CombatSimulator(make_pcs(pc_weapon), make_npcs(npc_protection))
+    scalar = simulator.simulate_multiple_combats(config=config)
+    vectorized = simulate_vectorized(make_pcs(pc_weapon), make_npcs(npc_protection), config)
+    return scalar, vectorized
+
+
+def test_build_domain_match():
+    domain_match = build_domain_match(make_pcs(), make_npcs())
+
+    assert domain_match.dtype == bool
+    assert domain_match.tolist() == [
+        [False, False, True],
+        [False, False, False],
+    ]
+
+
+def test_build_domain_match_empty():
+    assert build_domain_match([], make_npcs()).shape == (0, 3)
+    assert build_domain_match(make_pcs(), []).shape == (2, 0)
+
+
+def test_pick_kth_living():
+    standing = np.array(
+        [
+            [True, False, True, True],
+            [False, False, True, False],
+            [True, True, True, True],
+            [True, True, True, True],
+        ]
+    )
+    k = np.array([2, 0, 1, 3])
+
+    assert _pick_kth_living(standing, k).tolist() == [3, 2, 1, 3]
+
+
+def test_pick_kth_living_only_picks_standing():
+    rng = np.random.default_rng(1234)
+    standing = rng.random((500, 6)) < 0.5
+    live_count = standing.sum(axis=1)
+    standing = standing[live_count > 0]
+    live_count = live_count[live_count > 0]
+
+    for k_value in range(6):
+        k = np.minimum(k_value, live_count - 1)
+        target = _pick_kth_living(standing, k)
+        rows = np.arange(len(standing))
+
+        assert standing[rows, target].all()
+        # Exactly k standing characters come before the picked one
+        before = np.cumsum(standing, axis=1)[rows, target] - 1
+        assert (before == k).all()
+
+
+def test_single_round_fights_are_draws():
+    # Nobody can be defeated in a single round, so every counter is exact
+    fights = 300
+    scalar, vectorized = run_both(make_config(fights, max_rounds=1), pc_weapon=0)
+
+    for results in (scalar, vectorized):
+        assert results.total_fights == fights
+        assert results.draws == fights
+        assert results.total_rounds == fights
+        assert results.pc_attacks.tolist() == [fights, fights]
+        assert results.npc_attacks.tolist() == [fights, fights, fights]
+        assert results.pc_deaths.tolist() == [0, 0]
+
+
+def test_armored_npcs_are_never_defeated():
+    # Unarmed PCs deal at most 3 damage (1 plus a critical), all absorbed by protection
+    fights = 300
+    scalar, vectorized = run_both(make_config(fights), pc_weapon=0, npc_protection=3)
+
+    for results in (scalar, vectorized):
+        assert results.pc_victories == 0
+        assert results.npc_victories + results.draws == fights
+        # Unarmed hits deal exactly 1 damage, or 3 on a critical
+        assert (results.pc_damage >= results.pc_hits).all()
+        assert (results.pc_damage <= 3 * results.pc_hits).all()
+
+
+def test_scalar_and_vectorized_agree():
+    fights = 4000
+    scalar, vectorized = run_both(make_config(fights))
+
+    for outcome in ("pc_victories", "npc_victories", "draws"):
+        assert getattr(scalar, outcome) / fights == pytest.approx(
+            getattr(vectorized, outcome) / fights, abs=0.05
+        )
+    assert scalar.average_rounds == pytest.approx(vectorized.average_rounds, rel=0.1)
+
+    np.testing.assert_allclose(
+        scalar.pc_hits / scalar.pc_attacks, vectorized.pc_hits / vectorized.pc_attacks, atol=0.03
+    )
+    np.testing.assert_allclose(
+        scalar.npc_hits / scalar.npc_attacks, vectorized.npc_hits / vectorized.npc_attacks, atol=0.03
+    )
+    np.testing.assert_allclose(
+        scalar.pc_minor_fallouts / fights, vectorized.pc_minor_fallouts / fights, rtol=0.15, atol=0.05
+    )
+    np.testing.assert_allclose(
+        scalar.pc_deaths / fights, vectorized.pc_deaths / fights, rtol=0.2, atol=0.02
+    )
+
+
+def test_loaded_stress_at_limit_only_falls_out_when_hit():
+    # A PC loaded at 12 stress falls out on every hit and never otherwise
+    fights = 1000
+    config = make_config(fights, max_rounds=1)
+
+    def characters():
+        pc = Player(
+            name="Stressed",
+            player_class="Cleaver",
+            calling="Enlightenment",
+            abilities=PlayerAbilities(),
+            domains=PlayerDomains(),
+            weapon=0,
+            resistance=PlayerResistance(blood=12, echo=12, mind=12, fortune=12, supplies=12),
+        )
+        return [pc], make_npcs(protection=3)[:1]
+
+    scalar = CombatSimulator(*characters()).simulate_multiple_combats(config=config)
+    vectorized = simulate_vectorized(*characters(), config)
+
+    for results in (scalar, vectorized):
+        assert results.npc_hits.sum() > 0
+        assert results.pc_minor_fallouts.tolist() == [results.npc_hits.sum()]
+
+
+def test_reset_characters_restores_loaded_stress():
+    pc = Player.from_dict(
+        {
+            "name": "Stressed",
+            "class": "Cleaver",
+            "calling": "Enlightenment",
+            "weapon": 4,
+            "resistance": {"blood": 3, "echo": 0, "mind": 7, "fortune": 1, "supplies": 11},
+        }
+    )
+    npcs = make_npcs()
+    simulator = CombatSimulator([pc], npcs)
+
+    # Push every type past 12 stress: five minor fallouts, two of them major
+    for resistance_idx in range(len(pc.resistance.values)):
+        simulator.apply_pc_damage(0, resistance_idx, 12)
+    npcs[0].take_damage(10)
+    assert pc.minor_fallouts == 5
+    assert pc.major_fallouts == 2
+    assert npcs[0].resistance < npcs[0].max_resistance
+
+    simulator.reset_characters()
+
+    assert pc.resistance.values.tolist() == [3, 0, 7, 1, 11]
+    assert pc.minor_fallouts == 0
+    assert pc.major_fallouts == 0
+    assert npcs[0].resistance == npcs[0].max_resistance
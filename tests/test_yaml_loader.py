@@ -0,0 +1,39 @@
+import os
+
+from module.yaml_loader import load_yaml
+
+
+def write_yaml(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_yaml_returns_independent_copies(tmp_path):
+    path = tmp_path / "pc.yaml"
+    write_yaml(path, "name: Daniel\nresistance:\n  blood: 2\n", 1_000_000_000)
+
+    first = load_yaml(str(path))
+    first["name"] = "Changed"
+    first["resistance"]["blood"] = 12
+
+    assert load_yaml(str(path)) == {"name": "Daniel", "resistance": {"blood": 2}}
+
+
+def test_load_yaml_reparses_when_mtime_changes(tmp_path):
+    path = tmp_path / "npc.yaml"
+    write_yaml(path, "resistance: 10\n", 1_000_000_000)
+    assert load_yaml(str(path)) == {"resistance": 10}
+
+    write_yaml(path, "resistance: 20\n", 2_000_000_000)
+    assert load_yaml(str(path)) == {"resistance": 20}
+
+
+def test_load_yaml_reuses_cache_for_unchanged_mtime(tmp_path):
+    path = tmp_path / "npc.yaml"
+    write_yaml(path, "resistance: 10\n", 1_000_000_000)
+    assert load_yaml(str(path)) == {"resistance": 10}
+
+    # Same mtime, so the cached parse is served and the file is not reread
+    write_yaml(path, "resistance: 20\n", 1_000_000_000)
+    assert load_yaml(str(path)) == {"resistance": 10}
+    assert load_yaml(str(path), mtime=os.stat(path).st_mtime_ns) == {"resistance": 10}